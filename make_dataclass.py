@@ -1,9 +1,13 @@
 #!/usr/bin/env python
 
 from typing import Type
-from json import load
 from sys import stderr
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 from pyutils.cli import MakeDataclassArgumentParser
 from pyutils.my_dataclasses import dataclass_to_code, dict_to_dataclass
 
@@ -11,7 +15,7 @@ from pyutils.my_dataclasses import dataclass_to_code, dict_to_dataclass
 def main():
     args: Type[MakeDataclassArgumentParser.Namespace] = MakeDataclassArgumentParser().parse_args()
 
-    json_data = load(fp=args.input_file)
+    json_data = json_loads(args.input_file.read())
 
     if isinstance(json_data, list):
         print('The input data is a list; using the first element.', file=stderr)
@@ -1,10 +1,11 @@
 from logging import getLogger
-from typing import Callable, Any, Iterable, Optional
-from asyncio import Task, Semaphore, Event, iscoroutine
-from contextvars import ContextVar, Token, copy_context
+from typing import Callable, Any, Iterable
+from asyncio import Task, Queue, CancelledError, wait, gather, iscoroutine
 
 LOG = getLogger(__name__)
 
+_WORKER_STOP_SENTINEL = object()
+
 
 async def limited_gather(
     iteration_coroutine: Callable[[Any], Any],
@@ -15,6 +16,9 @@ async def limited_gather(
     """
     Run coroutines concurrently with a maximum limit.
 
+    The values in the iterable are consumed by a fixed number of workers, each of which calls the coroutine with a
+    value and then calls the result callback, awaiting it in case it returns a coroutine.
+
     :param iteration_coroutine: A coroutine to call with the values in the iterable.
     :param iterable: An iterable with values to pass to the coroutine
     :param result_callback: A callback which to call with the result of a call to the coroutine.
@@ -25,50 +29,39 @@ async def limited_gather(
     if not iterable:
         return
 
-    limiting_semaphore = Semaphore(num_concurrent)
-    all_finished_event = Event()
-
-    num_started = 0
-    num_finished = 0
-
-    passed_iteration_value_context_var = ContextVar('passed_iteration_value')
-
-    def signal_callback_finished(*_, **__):
-        nonlocal num_finished
-        num_finished += 1
-        all_finished_event.set()
-
-    def task_done_callback(finished_task: Task) -> None:
-        limiting_semaphore.release()
-
-        response: Optional[Any] = None
-
-        try:
-            response = result_callback(finished_task, passed_iteration_value_context_var.get())
-        except:
-            LOG.exception(f'Unexpected exception in result callback.')
-        finally:
-            if iscoroutine(response):
-                Task(coro=response).add_done_callback(signal_callback_finished)
-                return
-
-            signal_callback_finished()
-
-    for iteration_value in iterable:
-        await limiting_semaphore.acquire()
-        num_started += 1
-
-        passed_iteration_value_token: Token = passed_iteration_value_context_var.set(iteration_value)
-
-        Task(
-            coro=iteration_coroutine(iteration_value)
-        ).add_done_callback(
-            task_done_callback,
-            context=copy_context()
-        )
-
-        passed_iteration_value_context_var.reset(passed_iteration_value_token)
-
-    while num_finished < num_started:
-        await all_finished_event.wait()
-        all_finished_event.clear()
+    value_queue = Queue(maxsize=num_concurrent * 2)
+
+    async def worker() -> None:
+        while (iteration_value := await value_queue.get()) is not _WORKER_STOP_SENTINEL:
+            iteration_task = Task(coro=iteration_coroutine(iteration_value))
+            try:
+                await wait((iteration_task,))
+            except CancelledError:
+                iteration_task.cancel()
+                raise
+
+            try:
+                response = result_callback(iteration_task, iteration_value)
+                if iscoroutine(response):
+                    await response
+            except Exception:
+                LOG.exception(f'Unexpected exception in result callback.')
+
+    async def produce() -> None:
+        for iteration_value in iterable:
+            await value_queue.put(iteration_value)
+
+        for _ in range(num_concurrent):
+            await value_queue.put(_WORKER_STOP_SENTINEL)
+
+    # NOTE: The producer is awaited together with the workers, so that an exception in a worker -- e.g. one raised
+    # synchronously by the coroutine function -- is propagated rather than leaving the producer blocked on a full queue.
+    tasks = [Task(coro=produce()), *(Task(coro=worker()) for _ in range(num_concurrent))]
+
+    try:
+        await gather(*tasks)
+    finally:
+        # NOTE: Only has an effect if a task failed or the wait was interrupted, in which case the remaining tasks --
+        # and the coroutine invocations the workers await -- would otherwise be left running.
+        for task in tasks:
+            task.cancel()
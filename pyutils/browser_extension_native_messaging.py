@@ -1,9 +1,12 @@
 from sys import stdout, stdin
-from struct import pack as struct_pack, unpack as struct_unpack
+from struct import pack as struct_pack, unpack_from as struct_unpack_from
 from typing import Union, Optional
 
 NUM_MESSAGE_LENGTH_SPECIFIER_BYTES = 4
 
+# NOTE: Shared by all calls to `read_message`, which is therefore not safe to call concurrently from multiple threads.
+_MESSAGE_LENGTH_SPECIFIER_BUFFER = bytearray(NUM_MESSAGE_LENGTH_SPECIFIER_BYTES)
+
 
 def _make_outgoing_message_bytes(message_bytes: bytes) -> bytes:
     """
@@ -47,8 +50,7 @@ def read_message() -> Optional[bytes]:
     :return: The bytes constituting the message passed by the browser extension.
     """
 
-    message_length_bytes: bytes = stdin.buffer.read(NUM_MESSAGE_LENGTH_SPECIFIER_BYTES)
-    if not message_length_bytes:
+    if stdin.buffer.readinto(_MESSAGE_LENGTH_SPECIFIER_BUFFER) != NUM_MESSAGE_LENGTH_SPECIFIER_BYTES:
         return None
 
-    return stdin.buffer.read(struct_unpack('=I', message_length_bytes)[0])
+    return stdin.buffer.read(struct_unpack_from('=I', _MESSAGE_LENGTH_SPECIFIER_BUFFER)[0])
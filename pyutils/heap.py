@@ -81,6 +81,64 @@ def _default_compare(
     return get_value(heap_sequence, left_hand_side_index) < get_value(heap_sequence, right_hand_side_index)
 
 
+def _fast_heapify_down(heap_sequence: MutableSequence[Any], node_index: int) -> None:
+    """
+    Establish the heap property starting from a node in a heap sequence, progressing downwards, using the default
+    value retrieval, comparison, and swap behaviour.
+
+    The default callables are inlined as direct indexing and "less than" comparisons.
+
+    :param heap_sequence: A sequence in which the node that is to have the heap property established can be located.
+    :param node_index: An index to the node in the heap sequence that is to have the heap property established.
+    :return: None
+    """
+
+    heap_length = len(heap_sequence)
+
+    while (left_index := 2 * node_index + 1) < heap_length:
+        right_index = left_index + 1
+
+        highest_priority_index = node_index
+        highest_priority_value = heap_sequence[node_index]
+
+        left = heap_sequence[left_index]
+        if left < highest_priority_value:
+            highest_priority_index = left_index
+            highest_priority_value = left
+
+        if right_index < heap_length and heap_sequence[right_index] < highest_priority_value:
+            highest_priority_index = right_index
+
+        if highest_priority_index == node_index:
+            break
+
+        heap_sequence[node_index], heap_sequence[highest_priority_index] = \
+            heap_sequence[highest_priority_index], heap_sequence[node_index]
+        node_index = highest_priority_index
+
+
+def _fast_heapify_up(heap_sequence: MutableSequence[Any], node_index: int) -> None:
+    """
+    Establish the heap property starting from a node in a heap sequence, progressing upwards, using the default
+    value retrieval, comparison, and swap behaviour.
+
+    The default callables are inlined as direct indexing and "less than" comparisons.
+
+    :param heap_sequence: A sequence in which the node that is to have the heap property established can be located.
+    :param node_index: An index to the node in the heap sequence that is to have the heap property established.
+    :return: None
+    """
+
+    while node_index > 0:
+        parent_index = (node_index - 1) // 2
+
+        if not heap_sequence[node_index] < heap_sequence[parent_index]:
+            break
+
+        heap_sequence[node_index], heap_sequence[parent_index] = heap_sequence[parent_index], heap_sequence[node_index]
+        node_index = parent_index
+
+
 def _heapify_down(
     heap_sequence: MutableSequence[Any],
     node_index: int,
@@ -99,29 +157,29 @@ def _heapify_down(
     :return: None
     """
 
-    left_index = 2 * node_index + 1
-    right_index = 2 * node_index + 1 + 1
+    if get_value is _default_get_value and compare is _default_compare and swap_elements is _default_swap_elements:
+        return _fast_heapify_down(heap_sequence=heap_sequence, node_index=node_index)
 
-    left = get_value(heap_sequence, left_index) if left_index < len(heap_sequence) else None
-    right = get_value(heap_sequence, right_index) if right_index < len(heap_sequence) else None
+    while True:
+        left_index = 2 * node_index + 1
+        right_index = 2 * node_index + 1 + 1
 
-    highest_priority_index = node_index
+        left = get_value(heap_sequence, left_index) if left_index < len(heap_sequence) else None
+        right = get_value(heap_sequence, right_index) if right_index < len(heap_sequence) else None
 
-    if left is not None and compare(heap_sequence, left_index, highest_priority_index, get_value):
-        highest_priority_index = left_index
+        highest_priority_index = node_index
 
-    if right is not None and compare(heap_sequence, right_index, highest_priority_index, get_value):
-        highest_priority_index = right_index
+        if left is not None and compare(heap_sequence, left_index, highest_priority_index, get_value):
+            highest_priority_index = left_index
 
-    if highest_priority_index != node_index:
-        swap_elements(heap_sequence, node_index, highest_priority_index)
+        if right is not None and compare(heap_sequence, right_index, highest_priority_index, get_value):
+            highest_priority_index = right_index
 
-        _heapify_down(
-            heap_sequence=heap_sequence,
-            node_index=highest_priority_index,
-            get_value=get_value,
-            compare=compare
-        )
+        if highest_priority_index == node_index:
+            break
+
+        swap_elements(heap_sequence, node_index, highest_priority_index)
+        node_index = highest_priority_index
 
 
 def _heapify_up(
@@ -142,6 +200,9 @@ def _heapify_up(
     :return:
     """
 
+    if get_value is _default_get_value and compare is _default_compare and swap_elements is _default_swap_elements:
+        return _fast_heapify_up(heap_sequence=heap_sequence, node_index=node_index)
+
     current_element_index = node_index
     parent_element_index = (current_element_index - 1) // 2
 
@@ -1,6 +1,7 @@
 from typing import Type, Set, Union, Optional, List
 from argparse import Action, ArgumentParser, Namespace, FileType
 from io import TextIOWrapper
+from itertools import chain
 
 
 def make_action_class(collection_name: str) -> Type[Action]:
@@ -13,9 +14,6 @@ def make_action_class(collection_name: str) -> Type[Action]:
     :return: A dynamically created custom `argparse.Action` class.
     """
 
-    # NOTE: The name will not be unique.
-    action_class = type(f'{collection_name}Action', (Action,), dict())
-
     def __call__(
         self,
         _: ArgumentParser,
@@ -24,23 +22,22 @@ def make_action_class(collection_name: str) -> Type[Action]:
         __: Optional[str] = None
     ) -> None:
 
-        collected_set: Set[str] = getattr(namespace, collection_name, set())
+        collected_set: Optional[Set[str]] = getattr(namespace, collection_name, None)
+        if collected_set is None:
+            collected_set = set()
 
         if isinstance(self.type, FileType):
             value_files: List[TextIOWrapper] = values
-            values_to_be_added = (
-                value.strip()
-                for value_file in value_files
-                for value in value_file.read().splitlines()
+            collected_set.update(
+                line.strip()
+                for line in chain.from_iterable(value_file.read().splitlines() for value_file in value_files)
             )
         else:
-            values_to_be_added = values
-
-        collected_set.update(values_to_be_added)
+            collected_set.update(values)
 
+        # NOTE: The collection is stored last, as `self.dest` may be the same attribute as `collection_name`.
         setattr(namespace, self.dest, values)
         setattr(namespace, collection_name, collected_set)
 
-    setattr(action_class, '__call__', __call__)
-
-    return action_class
+    # NOTE: The name will not be unique.
+    return type(f'{collection_name}Action', (Action,), dict(__call__=__call__))
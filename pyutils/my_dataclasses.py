@@ -1,13 +1,89 @@
 #!/usr/bin/env python
 
 from dataclasses import is_dataclass, fields, make_dataclass
-from typing import Any, get_origin, get_args, Optional, List, get_type_hints, Union, Type
+from typing import Any, get_origin, get_args, Optional, List, get_type_hints, Union, Type, Callable, NoReturn
 from abc import ABC
 from uuid import uuid4
+from functools import lru_cache
 
 from pyutils.my_string import to_snake_case, to_pascal_case
 
 
+def _raise_not_implemented(_: Any) -> NoReturn:
+    raise NotImplementedError
+
+
+def _make_field_deserializer(annotated_value_type: Any) -> Optional[Callable[[Any], Any]]:
+    """
+    Make a function that deserializes a JSON value into a value of a `JsonDataclass` field's annotated type.
+
+    :param annotated_value_type: The annotated type of the field.
+    :return: A function that deserializes a JSON value of the field, or `None` if the JSON value is to be used as-is.
+    """
+
+    # TODO: Do I need to use `get_origin` here?
+    if get_origin(annotated_value_type) is list:
+        list_annotated_value_type = get_args(annotated_value_type)
+        if len(list_annotated_value_type) != 1:
+            return _raise_not_implemented
+
+        list_annotated_value_type = list_annotated_value_type[0]
+
+        if is_dataclass(list_annotated_value_type) and issubclass(list_annotated_value_type, JsonDataclass):
+            return lambda value: [
+                list_annotated_value_type.from_json(json_object=element_kwargs)
+                for element_kwargs in value
+            ]
+
+        return None
+
+    if get_origin(annotated_value_type) is Union:
+        value_type_args = get_args(annotated_value_type)
+        if len(value_type_args) == 2 and value_type_args[1] is type(None):
+            annotated_value_type = value_type_args[0]
+        else:
+            return _raise_not_implemented
+
+    if is_dataclass(annotated_value_type) and issubclass(annotated_value_type, JsonDataclass):
+        return annotated_value_type.from_json
+
+    return None
+
+
+@lru_cache(maxsize=None)
+def _get_field_deserializers(cls: type) -> dict[str, Optional[Callable[[Any], Any]]]:
+    """
+    Map the field names of a `JsonDataclass` class to functions that deserialize the fields' JSON values.
+
+    The type hints of a class are fixed, so the map is made only once per class.
+
+    :param cls: A `JsonDataclass` class.
+    :return: A map of field names to deserialization functions, or to `None` for fields whose JSON values are to be
+        used as-is. The map is shared between calls and must not be mutated.
+    """
+
+    return {
+        field_name: _make_field_deserializer(annotated_value_type=annotated_value_type)
+        for field_name, annotated_value_type in get_type_hints(cls).items()
+    }
+
+
+@lru_cache(maxsize=None)
+def _get_nested_field_deserializers(cls: type) -> tuple[tuple[str, Callable[[Any], Any]], ...]:
+    """
+    Retrieve the fields of a `JsonDataclass` class whose JSON values are not to be used as-is.
+
+    :param cls: A `JsonDataclass` class.
+    :return: Pairs of field names and deserialization functions. Empty for classes whose fields are all used as-is.
+    """
+
+    return tuple(
+        (field_name, field_deserializer)
+        for field_name, field_deserializer in _get_field_deserializers(cls).items()
+        if field_deserializer is not None
+    )
+
+
 class JsonDataclass(ABC):
 
     def __init__(self, *args, **kwargs):
@@ -18,41 +94,18 @@ class JsonDataclass(ABC):
         if json_object is None:
             return None
 
-        prepared_kwargs: dict[str, Any] = {}
-
-        class_type_hints = get_type_hints(cls)
-
-        for key, value in json_object.items():
-            snake_cased_key: str = to_snake_case(string=key)
-            annotated_value_type = class_type_hints[snake_cased_key]
-
-            # TODO: Do I need to use `get_origin` here?
-            if get_origin(annotated_value_type) is list:
-                list_annotated_value_type = get_args(annotated_value_type)
-                if len(list_annotated_value_type) != 1:
-                    raise NotImplementedError
-
-                list_annotated_value_type = list_annotated_value_type[0]
-
-                if is_dataclass(list_annotated_value_type) and issubclass(list_annotated_value_type, JsonDataclass):
-                    prepared_kwargs[snake_cased_key] = [
-                        list_annotated_value_type.from_json(json_object=element_kwargs)
-                        for element_kwargs in value
-                    ]
-                else:
-                    prepared_kwargs[snake_cased_key] = value
-            else:
-                if get_origin(annotated_value_type) is Union:
-                    value_type_args = get_args(annotated_value_type)
-                    if len(value_type_args) == 2 and value_type_args[1] is type(None):
-                        annotated_value_type = value_type_args[0]
-                    else:
-                        raise NotImplementedError
-
-                if is_dataclass(annotated_value_type) and issubclass(annotated_value_type, JsonDataclass):
-                    prepared_kwargs[snake_cased_key] = annotated_value_type.from_json(json_object=value)
-                else:
-                    prepared_kwargs[snake_cased_key] = value
+        prepared_kwargs: dict[str, Any] = {
+            to_snake_case(string=key): value
+            for key, value in json_object.items()
+        }
+
+        if unknown_keys := prepared_kwargs.keys() - _get_field_deserializers(cls).keys():
+            raise KeyError(next(iter(unknown_keys)))
+
+        # NOTE: Classes without nested fields need no further processing.
+        for field_name, field_deserializer in _get_nested_field_deserializers(cls):
+            if field_name in prepared_kwargs:
+                prepared_kwargs[field_name] = field_deserializer(prepared_kwargs[field_name])
 
         return cls(**prepared_kwargs)
 
@@ -64,19 +117,8 @@ def dict_to_dataclass(obj, class_name: Optional[str] = None):
             fields=[(to_snake_case(string=name), dict_to_dataclass(value, name)) for name, value in obj.items()]
         )
     elif isinstance(obj, (list, tuple)):
-        type_set = set()
-        for element in obj:
-            res = dict_to_dataclass(element)
-            type_set.add(
-                tuple((field.name, field.type) for field in fields(res)) if is_dataclass(obj=res) else res
-            )
-
-        # if not type_set:
+        # NOTE: The element type is intentionally not inferred, as that would require converting every element.
         return list
-        # elif len(type_set) != 1:
-        #     raise ValueError
-
-        # return next(iter(type_set))
 
     elif isinstance(obj, (str, int, float)):
         return type(obj)
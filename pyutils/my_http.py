@@ -5,19 +5,36 @@ from http import HTTPStatus
 
 
 def status_ok(status_code: int) -> bool:
-    return 200 <= status_code <= 299
+    return 200 <= status_code < 300
 
 
 class HTTPStatusError(Exception, ABC):
+    __slots__ = ('response',)
+
     REASON_PHRASE: str = NotImplemented
     STATUS_CODE: int = NotImplemented
 
-    STATUS_CODE_TO_CLASS: Dict[int, Type[HTTPStatusError]] = NotImplemented
+    STATUS_CODE_TO_CLASS: Dict[int, Type[HTTPStatusError]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # NOTE: Only classes that define a status code themselves are registered, and only the first class to define a
+        # status code, so that classes defined later (e.g. downstream) do not take over the module's mapping.
+        if 'STATUS_CODE' not in cls.__dict__ or cls.STATUS_CODE is NotImplemented:
+            return
+
+        HTTPStatusError.STATUS_CODE_TO_CLASS.setdefault(cls.STATUS_CODE, cls)
 
     def __init__(self, response=None):
         super().__init__(f'{self.STATUS_CODE} {self.REASON_PHRASE}')
         self.response = response
 
+    def __reduce__(self):
+        # NOTE: `BaseException.__reduce__` carries only `args` and `__dict__`, not slot values, so `response` is passed
+        # explicitly; otherwise the message would be passed as `response` when the error is unpickled or copied.
+        return type(self), (self.response,), self.__dict__ or None
+
     @classmethod
     def from_status_code(cls, status_code: Union[int, HTTPStatus], response=None) -> HTTPStatusError:
         return cls.STATUS_CODE_TO_CLASS[int(status_code)](response=response)
@@ -230,46 +247,3 @@ class NetworkAuthenticationRequiredError(HTTPServerStatusError):
     REASON_PHRASE: str = 'Network Authentication Required (RFC 6585)'
     STATUS_CODE: int = 511
 
-
-HTTPStatusError.STATUS_CODE_TO_CLASS = {
-    400: BadRequestError,
-    401: UnauthorizedError,
-    402: PaymentRequiredError,
-    403: ForbiddenError,
-    404: NotFoundError,
-    405: MethodNotAllowedError,
-    406: NotAcceptableError,
-    407: ProxyAuthenticationRequiredError,
-    408: RequestTimeoutError,
-    409: ConflictError,
-    410: GoneError,
-    411: LengthRequiredError,
-    412: PreconditionFailedError,
-    413: PayloadTooLargeError,
-    414: URITooLongError,
-    415: UnsupportedMediaTypeError,
-    416: RangeNotSatisfiableError,
-    417: ExpectationFailedError,
-    418: ImATeapotError,
-    421: MisdirectedRequestError,
-    422: UnprocessableEntityError,
-    423: LockedError,
-    424: FailedDependencyError,
-    425: TooEarlyError,
-    426: UpgradeRequiredError,
-    428: PreconditionRequiredError,
-    429: TooManyRequestsError,
-    431: RequestHeaderFieldsTooLargeError,
-    451: UnavailableForLegalReasonsError,
-    500: InternalServerErrorError,
-    501: NotImplementedStatusError,
-    502: BadGatewayError,
-    503: ServiceUnavailableError,
-    504: GatewayTimeoutError,
-    505: HTTPVersionNotSupportedError,
-    506: VariantAlsoNegotiatesError,
-    507: InsufficientStorageError,
-    508: LoopDetectedError,
-    510: NotExtendedError,
-    511: NetworkAuthenticationRequiredError
-}
@@ -1,10 +1,26 @@
-from typing import Dict, Any, Pattern, Optional
-from re import compile as re_compile, sub as re_sub, escape as re_escape
-
-_CAMEL_CASED_LETTER_PATTERN = re_compile(pattern=r'(?<=.)((?<=[a-z])[A-Z]|[A-Z](?=[a-z]))')
+from typing import Dict, Any, Pattern, Match, Optional
+from re import compile as re_compile, escape as re_escape
+from functools import lru_cache
 
 _SNAKE_KEBAB_CASED_LETTER_PATTERN = re_compile(pattern=r'[-_]([A-Za-z])')
 
+_snake_kebab_cased_letter_sub = _SNAKE_KEBAB_CASED_LETTER_PATTERN.sub
+
+
+def _uppercase_snake_kebab_cased_letters(string: str) -> str:
+    """
+    Remove the hyphens and underscores that precede letters in a string and upper-case those letters.
+
+    :param string: A string in which to upper-case letters preceded by hyphens and underscores.
+    :return: The string with the hyphens and underscores removed and the letters upper-cased.
+    """
+
+    # NOTE: Strings without delimiters (e.g. ones that are already camel- or Pascal-cased) need no substitution.
+    if '_' not in string and '-' not in string:
+        return string
+
+    return _snake_kebab_cased_letter_sub(repl=lambda match: match.group(1).upper(), string=string)
+
 
 def uppercase_first_character(string: str) -> str:
     """
@@ -13,7 +29,7 @@ def uppercase_first_character(string: str) -> str:
     :return:
     """
 
-    return re_sub(pattern=r'^.', repl=lambda match: match.group(0).capitalize(), string=string)
+    return string[:1].capitalize() + string[1:]
 
 
 def lowercase_first_character(string: str) -> str:
@@ -23,9 +39,10 @@ def lowercase_first_character(string: str) -> str:
     :return:
     """
 
-    return re_sub(pattern=r'^.', repl=lambda match: match.group(0).lower(), string=string)
+    return string[:1].lower() + string[1:]
 
 
+@lru_cache(maxsize=4096)
 def to_snake_case(string: str) -> str:
     """
     Convert a string into a snake-cased representation.
@@ -34,11 +51,30 @@ def to_snake_case(string: str) -> str:
     :return: A snake-cased representation of the provided string.
     """
 
-    return _CAMEL_CASED_LETTER_PATTERN.sub(repl=lambda match: f'_{match.group(0)}', string=string.replace('-', '')) \
-        .replace('-', '_') \
-        .lower()
+    # NOTE: An underscore is inserted before each ASCII upper-case letter that is not the first character and that
+    # either follows a lower-case letter or precedes one (given that it does not follow a line break). A hand-written
+    # loop is faster than a regular expression substitution for identifier-length strings.
+
+    string = string.replace('-', '')
+    last_index = len(string) - 1
+
+    snake_cased_characters: list[str] = []
+    previous_character = ''
+
+    for index, character in enumerate(string):
+        if 'A' <= character <= 'Z' and index != 0 and (
+            'a' <= previous_character <= 'z'
+            or (previous_character != '\n' and index < last_index and 'a' <= string[index + 1] <= 'z')
+        ):
+            snake_cased_characters.append('_')
 
+        snake_cased_characters.append(character)
+        previous_character = character
 
+    return ''.join(snake_cased_characters).lower()
+
+
+@lru_cache(maxsize=4096)
 def to_pascal_case(string: str) -> str:
     """
     Convert a string into a Pascal-cased representation.
@@ -48,7 +84,7 @@ def to_pascal_case(string: str) -> str:
     """
 
     return uppercase_first_character(
-        string=_SNAKE_KEBAB_CASED_LETTER_PATTERN.sub(repl=lambda match: match.group(1).upper(), string=string)
+        string=_uppercase_snake_kebab_cased_letters(string=string)
     )
 
 
@@ -61,7 +97,7 @@ def to_camel_case(string: str) -> str:
     """
 
     return lowercase_first_character(
-        string=_SNAKE_KEBAB_CASED_LETTER_PATTERN.sub(repl=lambda match: match.group(1).upper(), string=string)
+        string=_uppercase_snake_kebab_cased_letters(string=string)
     )
 
 
@@ -88,19 +124,47 @@ def text_align_delimiter(text: str, delimiter: str = ': ', put_non_match_after_d
     :return: The input text aligned around the specified delimiter.
     """
 
-    max_delimiter_pos: int = max(
-        line.find(delimiter)
-        for line in text.splitlines()
-    )
+    lines: list[str] = text.splitlines()
+    delimiter_positions: list[int] = [line.find(delimiter) for line in lines]
+
+    max_delimiter_pos: int = max(delimiter_positions)
+    non_match_padding: str = ' ' * (max_delimiter_pos + len(delimiter)) if put_non_match_after_delimiter else ''
 
-    return '\n'.join(
-        (
-            (line[:delimiter_pos].rjust(max_delimiter_pos) + line[delimiter_pos:])
-            if (delimiter_pos := line.find(delimiter)) != -1 else (
-                (' ' * (max_delimiter_pos + len(delimiter)) + line) if (line and put_non_match_after_delimiter) else line
-            )
-        )
-        for line in text.splitlines()
+    aligned_lines: list[str] = []
+
+    for line, delimiter_pos in zip(lines, delimiter_positions):
+        if delimiter_pos != -1:
+            aligned_lines.append(line[:delimiter_pos].rjust(max_delimiter_pos) + line[delimiter_pos:])
+        elif line:
+            aligned_lines.append(non_match_padding + line)
+        else:
+            aligned_lines.append(line)
+
+    return '\n'.join(aligned_lines)
+
+
+@lru_cache(maxsize=32)
+def _make_var_pattern(var_char: str, end_var_char: Optional[str]) -> Pattern:
+    """
+    Make a pattern that matches variable references, as described in `expand_var`.
+
+    The patterns are cached, as the same variable syntax tends to be used repeatedly.
+
+    :param var_char: A character that is immediately to the left of the variable name, and that surrounds it if
+        `end_var_char` is an empty string.
+    :param end_var_char: A character that is immediately to the right of the variable name, or `None`.
+    :return: A pattern with a `variable_name` group that matches variable references.
+    """
+
+    escaped_var_char: str = re_escape(var_char)
+
+    if end_var_char is None:
+        return re_compile(f'{escaped_var_char}(?P<variable_name>.+?)\\b')
+
+    # NOTE: `end_var_char` should not be escaped within the bracket expression ("[]"), as characters within such
+    # expressions are parsed literally.
+    return re_compile(
+        f'{escaped_var_char}(?P<variable_name>[^{end_var_char or var_char}]+){re_escape(end_var_char or var_char)}'
     )
 
 
@@ -133,32 +197,18 @@ def expand_var(
     :return: The variable-expanded string.
     """
 
-    escaped_var_char: str = re_escape(var_char)
+    var_pattern: Pattern = _make_var_pattern(var_char=var_char, end_var_char=end_var_char)
 
-    if end_var_char is None:
-        var_pattern: Pattern = re_compile(f'{escaped_var_char}(?P<variable_name>.+?)\\b')
-    else:
-        # NOTE: `end_var_char` should not be escaped within the bracket expression ("[]"), as characters within such
-        # expressions are parsed literally.
-        var_pattern: Pattern = re_compile(
-            f'{escaped_var_char}(?P<variable_name>[^{end_var_char or var_char}]+){re_escape(end_var_char or var_char)}'
-        )
-
-    search_start_offset = 0
-    while match := var_pattern.search(string=string, pos=search_start_offset):
-        var_pos_start, var_pos_end = match.span(0)
-
-        variable_name: str = match.groupdict()['variable_name']
+    def expand_match(match: Match) -> str:
+        variable_name: str = match.group('variable_name')
         if not case_sensitive:
             variable_name = variable_name.lower()
 
         if variable_name in expand_map:
-            expanded_head: str = string[:var_pos_start] + str(expand_map[variable_name])
-            string: str = expanded_head + string[var_pos_end:]
-            search_start_offset: int = len(expanded_head)
+            return str(expand_map[variable_name])
         elif exception_on_unexpanded:
             raise KeyError(f'The variable name {variable_name} is not in the expand map.')
         else:
-            search_start_offset: int = var_pos_end
+            return match.group(0)
 
-    return string
+    return var_pattern.sub(repl=expand_match, string=string)
@@ -15,6 +15,10 @@ ByteLike = NewType('ByteLike', _byte_like_union)
 IntLike = NewType('IntLike', _int_like_union)
 StrLike = NewType('StrLike', _str_like_union)
 
+_byte_like_types = get_args(_byte_like_union)
+_int_like_types = get_args(_int_like_union)
+_str_like_types = get_args(_str_like_union)
+
 
 def is_byte_like(value: Any) -> bool:
     """
@@ -24,7 +28,7 @@ def is_byte_like(value: Any) -> bool:
     :return: Whether the value is byte-like.
     """
 
-    return isinstance(value, get_args(_byte_like_union))
+    return isinstance(value, _byte_like_types)
 
 
 def is_int_like(value: Any) -> bool:
@@ -35,7 +39,7 @@ def is_int_like(value: Any) -> bool:
     :return: Whether the value is int-like.
     """
 
-    return isinstance(value, get_args(_int_like_union))
+    return isinstance(value, _int_like_types)
 
 
 def is_str_like(value: Any) -> bool:
@@ -46,4 +50,4 @@ def is_str_like(value: Any) -> bool:
     :return: Whether the value is str-like.
     """
 
-    return isinstance(value, get_args(_str_like_union))
+    return isinstance(value, _str_like_types)
@@ -0,0 +1,43 @@
+from asyncio import run, wait_for
+from unittest import TestCase, main
+
+from pyutils.asyncio import limited_gather
+
+
+class LimitedGatherTestCase(TestCase):
+
+    def test_results_are_passed_to_callback(self):
+        results = []
+
+        async def double(value):
+            return value * 2
+
+        run(
+            limited_gather(
+                iteration_coroutine=double,
+                iterable=range(20),
+                result_callback=lambda task, value: results.append((value, task.result())),
+                num_concurrent=3
+            )
+        )
+
+        self.assertEqual(sorted(results), [(value, value * 2) for value in range(20)])
+
+    def test_synchronous_exception_in_coroutine_function_is_raised(self):
+        async def gather_with_timeout():
+            await wait_for(
+                limited_gather(
+                    iteration_coroutine=lambda value: 1 / 0,
+                    iterable=range(100),
+                    result_callback=lambda task, value: None,
+                    num_concurrent=2
+                ),
+                timeout=5
+            )
+
+        with self.assertRaises(ZeroDivisionError):
+            run(gather_with_timeout())
+
+
+if __name__ == '__main__':
+    main()
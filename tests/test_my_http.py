@@ -0,0 +1,30 @@
+from copy import copy, deepcopy
+from pickle import dumps, loads
+from unittest import TestCase, main
+
+from pyutils.my_http import HTTPStatusError, HTTPClientStatusError, NotFoundError
+
+
+class HTTPStatusErrorTestCase(TestCase):
+
+    def test_response_survives_pickle_and_copy(self):
+        error = HTTPStatusError.from_status_code(404, response={'x': 1})
+
+        for round_tripped_error in (loads(dumps(error)), copy(error), deepcopy(error)):
+            self.assertIsInstance(round_tripped_error, NotFoundError)
+            self.assertEqual(round_tripped_error.response, {'x': 1})
+            self.assertEqual(str(round_tripped_error), '404 Not Found')
+
+    def test_later_classes_do_not_take_over_status_codes(self):
+        class SubclassedNotFoundError(NotFoundError):
+            pass
+
+        class RedefinedNotFoundError(HTTPClientStatusError):
+            REASON_PHRASE: str = 'Not Found'
+            STATUS_CODE: int = 404
+
+        self.assertIs(type(HTTPStatusError.from_status_code(404)), NotFoundError)
+
+
+if __name__ == '__main__':
+    main()